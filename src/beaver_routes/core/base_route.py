@@ -1,5 +1,6 @@
 # src/beaver_routes/core/base_route.py
 
+from __future__ import annotations
 
 from beaver_routes.core.hook import Hook
 from beaver_routes.core.hook_manager import HookManager
@@ -11,6 +12,11 @@ from beaver_routes.core.scenario_manager import ScenarioManager
 from beaver_routes.core.validator_manager import ValidatorManager
 
 
+# Routes that are not given a handler share this one, and with it the
+# process-wide client.
+_default_request_handler = RequestHandler()
+
+
 class BaseRoute:
     """Base class for defining routes with customizable hooks and metadata.
 
@@ -84,19 +90,47 @@ class BaseRoute:
             Make an asynchronous OPTIONS request.
     """
 
-    def __init__(self, endpoint: str = "", auto_validate: bool = False) -> None:
+    __slots__ = (
+        "endpoint",
+        "meta",
+        "hooks",
+        "scenario",
+        "request_handler",
+        "validator_manager",
+        "__weakref__",
+    )
+
+    # The managers below only expose static methods, so every route shares one
+    # instance instead of allocating its own on construction.
+    hook_manager: HookManager = HookManager()
+    scenario_manager: ScenarioManager = ScenarioManager()
+
+    def __init__(
+        self,
+        endpoint: str = "",
+        auto_validate: bool = False,
+        request_handler: RequestHandler | None = None,
+    ) -> None:
         """Initialize the BaseRoute with the given endpoint.
 
         Args:
             endpoint (str): The URL endpoint for the route. Defaults to an empty string.
+            auto_validate (bool): Whether to apply the validators to every response.
+            request_handler (RequestHandler | None): The handler used to send this
+                route's requests, e.g. one built with injected httpx clients.
+                Defaults to a handler shared by all routes.
+
+        Example:
+            >>> handler = RequestHandler(client=httpx.Client())
+            >>> route = BaseRoute("http://example.com", request_handler=handler)
         """
         self.endpoint: str = endpoint
         self.meta: Meta = Meta()
         self.hooks: Hook = Hook()
         self.scenario: str | None = None
-        self.request_handler = RequestHandler()
-        self.hook_manager = HookManager()
-        self.scenario_manager = ScenarioManager()
+        self.request_handler: RequestHandler = (
+            _default_request_handler if request_handler is None else request_handler
+        )
         self.validator_manager = ValidatorManager()
         self.validator_manager.enabled = auto_validate
 
@@ -246,7 +280,7 @@ class BaseRoute:
                 self, self.scenario, method_meta, method_hooks
             )
 
-        self.hook_manager.apply_hooks(
+        await self.hook_manager.async_apply_hooks(
             method_hooks, "request", method, self.endpoint, method_meta
         )
 
@@ -260,7 +294,7 @@ class BaseRoute:
 
         response = Response(_response)
 
-        self.hook_manager.apply_hooks(method_hooks, "response", response)
+        await self.hook_manager.async_apply_hooks(method_hooks, "response", response)
         self.validator_manager.apply_validators(response)
         return response
 
@@ -1,3 +1,4 @@
+import inspect
 from typing import Any, Callable, List
 
 
@@ -16,6 +17,8 @@ class Hook:
             Add a hook function for a specified event (request or response).
         apply_hooks(event: str, *args: Any, **kwargs: Any) -> None:
             Apply all hooks for a specified event with provided arguments.
+        async_apply_hooks(event: str, *args: Any, **kwargs: Any) -> None:
+            Apply all hooks for a specified event, awaiting any awaitable results.
     """
 
     def __init__(self) -> None:
@@ -72,3 +75,35 @@ class Hook:
                 hook(*args, **kwargs)
         else:
             raise ValueError("Event must be 'request' or 'response'")
+
+    async def async_apply_hooks(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """Apply all hooks for a specified event, awaiting any awaitable results.
+
+        Plain functions are called directly; only hooks that return an awaitable
+        (such as ``async def`` hooks) are awaited.
+
+        Args:
+            event (str): The event for which hooks are applied. Must be "request" or "response".
+            *args (Any): Positional arguments to pass to the hook functions.
+            **kwargs (Any): Keyword arguments to pass to the hook functions.
+
+        Raises:
+            ValueError: If the event is not "request" or "response".
+
+        Example:
+            >>> async def my_request_hook(method, url, meta):
+            ...     print(f"Request: {method} {url}")
+            >>> hook = Hook()
+            >>> hook.add("request", my_request_hook)
+            >>> await hook.async_apply_hooks("request", "GET", "http://example.com", {})
+        """
+        if event == "request":
+            hooks = self.request_hooks
+        elif event == "response":
+            hooks = self.response_hooks
+        else:
+            raise ValueError("Event must be 'request' or 'response'")
+        for hook in hooks:
+            result = hook(*args, **kwargs)
+            if inspect.isawaitable(result):
+                await result
@@ -12,6 +12,8 @@ class HookManager:
     Methods:
         apply_hooks(hooks: Hook, event: str, *args: Any, **kwargs: Any) -> None:
             Apply all hooks for a specified event with provided arguments.
+        async_apply_hooks(hooks: Hook, event: str, *args: Any, **kwargs: Any) -> None:
+            Apply all hooks for a specified event, awaiting any awaitable results.
     """
 
     @staticmethod
@@ -32,3 +34,24 @@ class HookManager:
             >>> HookManager.apply_hooks(hook, "request", "GET", "http://example.com", {"param": "value"})
         """
         hooks.apply_hooks(event, *args, **kwargs)
+
+    @staticmethod
+    async def async_apply_hooks(
+        hooks: Hook, event: str, *args: Any, **kwargs: Any
+    ) -> None:
+        """Apply all hooks for a specified event, awaiting any awaitable results.
+
+        Args:
+            hooks (Hook): The Hook object containing request and response hooks.
+            event (str): The event for which hooks are applied. Must be "request" or "response".
+            *args (Any): Positional arguments to pass to the hook functions.
+            **kwargs (Any): Keyword arguments to pass to the hook functions.
+
+        Example:
+            >>> async def my_request_hook(method, url, meta):
+            ...     print(f"Request: {method} {url}")
+            >>> hook = Hook()
+            >>> hook.add("request", my_request_hook)
+            >>> await HookManager.async_apply_hooks(hook, "request", "GET", "http://example.com", {})
+        """
+        await hooks.async_apply_hooks(event, *args, **kwargs)
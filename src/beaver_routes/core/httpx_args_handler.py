@@ -2,11 +2,15 @@ from typing import Any, Dict
 
 from box import Box
 
+from beaver_routes.core.http_methods import DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT
 from beaver_routes.exceptions.exceptions import (
     InvalidHttpMethodError,
     InvalidHttpxArgumentsError,
 )
 
+_VALID_METHODS = frozenset((GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS))
+_BODY_METHODS = frozenset((POST, PUT, PATCH))
+
 
 class HttpxArgsHandler:
     """Handler for converting Meta objects to httpx-compatible arguments.
@@ -35,16 +39,16 @@ class HttpxArgsHandler:
             InvalidHttpMethodError: If the HTTP method is invalid.
             InvalidHttpxArgumentsError: If there is an error in the arguments.
         """
-        valid_methods = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
-        if method not in valid_methods:
+        if method not in _VALID_METHODS:
             raise InvalidHttpMethodError(f"Invalid HTTP method: {method}")
 
         try:
-            args = HttpxArgsHandler._build_common_args(meta)
-            if method in {"POST", "PUT", "PATCH"}:
-                HttpxArgsHandler._add_body_args(meta, args)
+            attributes = meta._attributes
+            args = HttpxArgsHandler._build_common_args(attributes)
+            if method in _BODY_METHODS:
+                HttpxArgsHandler._add_body_args(attributes, args)
             else:
-                HttpxArgsHandler._add_content_arg(meta, args)
+                HttpxArgsHandler._add_content_arg(attributes, args)
 
             return {k: v for k, v in args.items() if v is not None}
         except InvalidHttpMethodError as e:
@@ -53,78 +57,72 @@ class HttpxArgsHandler:
             raise InvalidHttpxArgumentsError(f"Invalid arguments for httpx: {e}")
 
     @staticmethod
-    def _build_common_args(meta: Any) -> Dict[str, Any]:
-        """Build common arguments for httpx requests from the Meta object.
+    def _build_common_args(attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """Build common arguments for httpx requests from the Meta sections.
 
         Args:
-            meta (Any): The Meta object containing request metadata.
+            attributes (Dict[str, Any]): The sections of the Meta object.
 
         Returns:
             Dict[str, Any]: The common arguments for httpx requests.
         """
-
-        def empty_to_none(value: Any) -> Any:
-            if isinstance(value, Box) and not value:
-                return None
-            return value
-
+        to_plain = HttpxArgsHandler._to_plain
         return {
-            "params": empty_to_none(
-                meta._attributes.params.to_dict() if meta._attributes.params else None
-            ),
-            "headers": empty_to_none(
-                meta._attributes.headers.to_dict() if meta._attributes.headers else None
-            ),
-            "cookies": empty_to_none(
-                meta._attributes.cookies.to_dict() if meta._attributes.cookies else None
-            ),
-            "auth": meta._attributes.auth,
-            "follow_redirects": meta._attributes.follow_redirects,
-            "timeout": meta._attributes.timeout,
-            "extensions": empty_to_none(
-                meta._attributes.extensions.to_dict()
-                if meta._attributes.extensions
-                else None
-            ),
+            "params": to_plain(attributes.get("params")),
+            "headers": to_plain(attributes.get("headers")),
+            "cookies": to_plain(attributes.get("cookies")),
+            "auth": attributes.get("auth"),
+            "follow_redirects": attributes.get("follow_redirects"),
+            "timeout": attributes.get("timeout"),
+            "extensions": to_plain(attributes.get("extensions")),
         }
 
     @staticmethod
-    def _add_body_args(meta: Any, args: Dict[str, Any]) -> None:
-        """Add body arguments for httpx requests from the Meta object.
+    def _add_body_args(attributes: Dict[str, Any], args: Dict[str, Any]) -> None:
+        """Add body arguments for httpx requests from the Meta sections.
 
         Args:
-            meta (Any): The Meta object containing request metadata.
+            attributes (Dict[str, Any]): The sections of the Meta object.
             args (Dict[str, Any]): The arguments dictionary to update.
         """
+        if json := attributes.get("json"):
+            args["json"] = HttpxArgsHandler._to_plain(json)
+        elif data := attributes.get("data"):
+            args["data"] = HttpxArgsHandler._to_plain(data)
+        elif files := attributes.get("files"):
+            args["files"] = HttpxArgsHandler._to_plain(files)
+        elif content := attributes.get("content"):
+            args["content"] = HttpxArgsHandler._box_to_string_or_bytes(content)
+
+    @staticmethod
+    def _to_plain(value: Any) -> Any:
+        """Convert a Meta section to its plain httpx form in a single pass.
 
-        def box_to_dict_or_value(value: Any) -> Any:
-            if isinstance(value, Box):
-                return value.to_dict()
-            return value
-
-        if meta._attributes.json:
-            args["json"] = box_to_dict_or_value(meta._attributes.json)
-        elif meta._attributes.data:
-            args["data"] = box_to_dict_or_value(meta._attributes.data)
-        elif meta._attributes.files:
-            args["files"] = box_to_dict_or_value(meta._attributes.files)
-        elif meta._attributes.content:
-            args["content"] = HttpxArgsHandler._box_to_string_or_bytes(
-                meta._attributes.content
-            )
+        Empty sections map to None so they are dropped from the arguments, and
+        Box sections are converted to a dict with one recursive ``to_dict`` call.
+
+        Args:
+            value (Any): The section value to convert.
+
+        Returns:
+            Any: The plain dictionary, the value itself, or None if it is empty.
+        """
+        if not value:
+            return None
+        if isinstance(value, Box):
+            return value.to_dict()
+        return value
 
     @staticmethod
-    def _add_content_arg(meta: Any, args: Dict[str, Any]) -> None:
-        """Add content argument for httpx requests from the Meta object.
+    def _add_content_arg(attributes: Dict[str, Any], args: Dict[str, Any]) -> None:
+        """Add content argument for httpx requests from the Meta sections.
 
         Args:
-            meta (Any): The Meta object containing request metadata.
+            attributes (Dict[str, Any]): The sections of the Meta object.
             args (Dict[str, Any]): The arguments dictionary to update.
         """
-        if meta._attributes.content:
-            args["content"] = HttpxArgsHandler._box_to_string_or_bytes(
-                meta._attributes.content
-            )
+        if content := attributes.get("content"):
+            args["content"] = HttpxArgsHandler._box_to_string_or_bytes(content)
 
     @staticmethod
     def _box_to_string_or_bytes(value: Any) -> Any:
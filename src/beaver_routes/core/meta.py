@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Dict, Union, cast
+from typing import Any, Dict, Union
 
 from box import Box
 
@@ -17,13 +17,27 @@ from beaver_routes._types._types import (
 )
 from beaver_routes.core.httpx_args_handler import HttpxArgsHandler
 from beaver_routes.exceptions.exceptions import (
-    AttributeNotFoundError,
     InvalidAdditionError,
     InvalidHttpMethodError,
     InvalidHttpxArgumentsError,
     MetaError,
 )
 
+_SECTIONS = (
+    "params",
+    "headers",
+    "cookies",
+    "auth",
+    "follow_redirects",
+    "timeout",
+    "extensions",
+    "content",
+    "data",
+    "files",
+    "json",
+)
+_VALUE_SECTIONS = frozenset(("auth", "follow_redirects", "timeout", "extensions"))
+
 
 class Meta:
     """Class representing metadata for HTTP requests.
@@ -87,32 +101,29 @@ class Meta:
             files (FilesType, optional): Files. Defaults to None.
             json (Any, optional): JSON data. Defaults to None.
         """
-        self._attributes = Box(default_box=True)
-        self._attributes.params = (
-            self._wrap(params) if params is not None else Box(default_box=True)
-        )
-        self._attributes.headers = (
-            self._wrap(headers) if headers is not None else Box(default_box=True)
-        )
-        self._attributes.cookies = (
-            self._wrap(cookies) if cookies is not None else Box(default_box=True)
-        )
-        self._attributes.auth = auth
-        self._attributes.follow_redirects = follow_redirects
-        self._attributes.timeout = timeout
-        self._attributes.extensions = self._wrap(extensions)
-        self._attributes.content = (
-            content if content is not None else Box(default_box=True)
-        )
-        self._attributes.data = (
-            self._wrap(data) if data is not None else Box(default_box=True)
-        )
-        self._attributes.files = (
-            self._wrap(files) if files is not None else Box(default_box=True)
-        )
-        self._attributes.json = (
-            self._wrap(json) if json is not None else Box(default_box=True)
-        )
+        # Sections are only stored once they hold a value; unset ones are created
+        # on first access, so an empty Meta allocates no Box at all.
+        attributes: Dict[str, Any] = {}
+        for name, value in (
+            ("params", params),
+            ("headers", headers),
+            ("cookies", cookies),
+            ("extensions", extensions),
+            ("data", data),
+            ("files", files),
+            ("json", json),
+        ):
+            if value is not None:
+                attributes[name] = self._wrap(value)
+        for name, value in (
+            ("auth", auth),
+            ("follow_redirects", follow_redirects),
+            ("timeout", timeout),
+            ("content", content),
+        ):
+            if value is not None:
+                attributes[name] = value
+        self._attributes = attributes
 
     def _wrap(self, value: Any) -> Any:
         """Wrap a dictionary value in a Box object.
@@ -128,6 +139,11 @@ class Meta:
     def __getattr__(self, name: str) -> Any:
         """Get an attribute from the Meta object.
 
+        The sections live in a plain dictionary, so reading one is a single dict
+        lookup. An unset auth, follow_redirects, timeout or extensions reads as
+        None; any other missing section is created as an empty Box on first
+        access, so it can be populated through attribute-style assignment.
+
         Args:
             name (str): The name of the attribute.
 
@@ -135,12 +151,20 @@ class Meta:
             Any: The value of the attribute.
 
         Raises:
-            AttributeNotFoundError: If the attribute is not found.
+            AttributeError: If ``_attributes`` is not set yet or a dunder name is
+                looked up, so protocols such as copy and pickle fall back to
+                their defaults.
         """
+        if name == "_attributes" or name.startswith("__"):
+            raise AttributeError(f"Attribute '{name}' not found in Meta")
+        attributes = self._attributes
         try:
-            return getattr(self._attributes, name)
-        except AttributeError:
-            raise AttributeNotFoundError(f"Attribute '{name}' not found in Meta")
+            return attributes[name]
+        except KeyError:
+            if name in _VALUE_SECTIONS:
+                return None
+            section = attributes[name] = Box(default_box=True)
+            return section
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set an attribute in the Meta object.
@@ -152,7 +176,7 @@ class Meta:
         if name == "_attributes":
             super().__setattr__(name, value)
         else:
-            setattr(self._attributes, name, self._wrap(value))
+            self._attributes[name] = self._wrap(value)
 
     def to_httpx_args(self, method: str) -> Dict[str, Any]:
         """Convert the metadata to `httpx` arguments.
@@ -191,27 +215,70 @@ class Meta:
             raise InvalidAdditionError("Cannot add non-Meta instance.")
 
         result = Meta()
-        for key, value in self._attributes.items():
-            if isinstance(value, Box) and isinstance(other._attributes[key], Box):
-                result._attributes[key] = value + other._attributes[key]
+        attributes = result._attributes
+        self_attributes = self._attributes
+        other_attributes = other._attributes
+        for key in {**self_attributes, **other_attributes}:
+            if key not in other_attributes:
+                attributes[key] = self._copy_section(self_attributes[key])
+            elif key not in self_attributes:
+                attributes[key] = self._copy_section(other_attributes[key])
             else:
-                result._attributes[key] = (
-                    other._attributes[key]
-                    if other._attributes[key] is not None
-                    else value
-                )
+                value = self_attributes[key]
+                other_value = other_attributes[key]
+                if isinstance(value, Box) and isinstance(other_value, Box):
+                    merged = value.to_dict()
+                    self._merge(merged, other_value.to_dict())
+                    attributes[key] = Box(merged, default_box=True)
+                else:
+                    attributes[key] = self._copy_section(
+                        other_value if other_value is not None else value
+                    )
         return result
 
+    @staticmethod
+    def _copy_section(value: Any) -> Any:
+        """Return a section value that is not shared with its source Meta.
+
+        Args:
+            value (Any): The section value to copy.
+
+        Returns:
+            Any: A new Box for Box sections, otherwise the value itself.
+        """
+        if isinstance(value, Box):
+            return Box(value.to_dict(), default_box=True)
+        return value
+
+    @staticmethod
+    def _merge(dest: Dict[str, Any], src: Dict[str, Any]) -> None:
+        """Merge one plain dictionary into another in place.
+
+        Values from ``src`` win. Only keys holding a dictionary on both sides are
+        merged recursively; every other value is assigned by reference.
+
+        Args:
+            dest (Dict[str, Any]): The dictionary to merge into.
+            src (Dict[str, Any]): The dictionary to merge from.
+        """
+        for key, value in src.items():
+            current = dest.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                Meta._merge(current, value)
+            else:
+                dest[key] = value
+
     def __repr__(self) -> str:
         """Return the string representation of the Meta object.
 
         Returns:
             str: The string representation of the Meta object.
         """
+        sections = self.to_dict()
         return (
-            f"Meta(params={self._attributes.params}, headers={self._attributes.headers}, cookies={self._attributes.cookies}, auth={self._attributes.auth}, "
-            f"follow_redirects={self._attributes.follow_redirects}, timeout={self._attributes.timeout}, extensions={self._attributes.extensions}, "
-            f"content={self._attributes.content}, data={self._attributes.data}, files={self._attributes.files}, json={self._attributes.json})"
+            f"Meta(params={sections['params']}, headers={sections['headers']}, cookies={sections['cookies']}, auth={sections['auth']}, "
+            f"follow_redirects={sections['follow_redirects']}, timeout={sections['timeout']}, extensions={sections['extensions']}, "
+            f"content={sections['content']}, data={sections['data']}, files={sections['files']}, json={sections['json']})"
         )
 
     def __str__(self) -> str:
@@ -228,7 +295,12 @@ class Meta:
         Returns:
             Dict[str, Any]: The dictionary representation of the Meta object.
         """
-        return cast(dict[str, Any], self._attributes.to_dict())
+        result: Dict[str, Any] = {
+            key: None if key in _VALUE_SECTIONS else {} for key in _SECTIONS
+        }
+        for key, value in self._attributes.items():
+            result[key] = value.to_dict() if isinstance(value, Box) else value
+        return result
 
     def copy(self) -> Meta:
         """Create a deep copy of the Meta object.
@@ -236,7 +308,7 @@ class Meta:
         Returns:
             Meta: The copied Meta object.
         """
-        copied_meta = Meta()
+        copied_meta = Meta.__new__(Meta)
         copied_meta._attributes = copy.deepcopy(self._attributes)
         return copied_meta
 
@@ -1,15 +1,47 @@
+from __future__ import annotations
+
+import atexit
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any
 
 import httpx
 
 from beaver_routes.core.response import Response
 
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Return the process-wide client used when none is injected.
+
+    The client is created on first use and closed at interpreter exit. Its
+    cookie jar accepts no cookies, so cookies set by one response are never
+    sent with a later, unrelated request.
+
+    Returns:
+        httpx.Client: The shared client.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[]))
+        )
+        atexit.register(_shared_client.close)
+    return _shared_client
+
 
 class RequestHandler:
     """Handler class for making HTTP requests.
 
-    This class provides static methods to make synchronous and asynchronous HTTP requests
+    This class provides methods to make synchronous and asynchronous HTTP requests
     using the httpx library. It abstracts the httpx.Client and httpx.AsyncClient usage.
+    A client may be injected so that its connection pool is reused across requests.
+    Otherwise synchronous requests go through one lazily created, process-wide
+    client, and a short-lived client is opened for each asynchronous request.
+
+    Attributes:
+        client (httpx.Client | None): The shared client for synchronous requests.
+        async_client (httpx.AsyncClient | None): The shared client for asynchronous requests.
 
     Methods:
         sync_request(method: str, url: str, **kwargs: Any) -> Response:
@@ -18,8 +50,23 @@ class RequestHandler:
             Make an asynchronous HTTP request.
     """
 
-    @staticmethod
-    def sync_request(method: str, url: str, **kwargs: Any) -> Response:
+    __slots__ = ("client", "async_client")
+
+    def __init__(
+        self,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the RequestHandler with optional shared clients.
+
+        Args:
+            client (httpx.Client | None): The client to reuse for synchronous requests.
+            async_client (httpx.AsyncClient | None): The client to reuse for asynchronous requests.
+        """
+        self.client = client
+        self.async_client = async_client
+
+    def sync_request(self, method: str, url: str, **kwargs: Any) -> Response:
         """Make a synchronous HTTP request.
 
         Args:
@@ -31,14 +78,13 @@ class RequestHandler:
             Response: The HTTP response.
 
         Example:
-            >>> response = RequestHandler.sync_request("GET", "http://example.com")
+            >>> response = RequestHandler().sync_request("GET", "http://example.com")
             >>> print(response.status_code)
         """
-        with httpx.Client() as client:
-            return Response(client.request(method=method, url=url, **kwargs))
+        client = self.client if self.client is not None else _get_shared_client()
+        return Response(client.request(method=method, url=url, **kwargs))
 
-    @staticmethod
-    async def async_request(method: str, url: str, **kwargs: Any) -> Response:
+    async def async_request(self, method: str, url: str, **kwargs: Any) -> Response:
         """Make an asynchronous HTTP request.
 
         Args:
@@ -50,9 +96,14 @@ class RequestHandler:
             Response: The HTTP response.
 
         Example:
-            >>> response = await RequestHandler.async_request("GET", "http://example.com")
+            >>> response = await RequestHandler().async_request("GET", "http://example.com")
             >>> print(response.status_code)
         """
+        if self.async_client is not None:
+            response: Any = await self.async_client.request(
+                method=method, url=url, **kwargs
+            )
+            return Response(response)
         async with httpx.AsyncClient() as client:
-            response: Any = await client.request(method=method, url=url, **kwargs)
+            response = await client.request(method=method, url=url, **kwargs)
             return Response(response)
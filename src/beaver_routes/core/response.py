@@ -1,5 +1,11 @@
+from functools import cached_property
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 
 class Response:
     """
@@ -12,8 +18,11 @@ class Response:
         response (Any): The actual HTTP response object.
         status_code (int): The HTTP status code of the response.
         headers (dict[str, str]): The headers of the response.
+        headers_lower (dict[str, str]): The headers of the response with lower-cased names.
         cookies (dict[str, str]): The cookies of the response.
         url (str): The URL of the response.
+        reason_phrase (str): The reason phrase of the response.
+        is_success (bool): Whether the response has a 2xx status code.
         content (bytes): The byte content of the response.
         text (str): The text content of the response.
     """
@@ -39,21 +48,33 @@ class Response:
         """
         return getattr(self._response, name)
 
-    @property
+    @cached_property
     def json_content(self) -> Any:
         """
         Return the JSON content of the response.
 
+        The body is decoded on first access and cached on the instance. When
+        ``orjson`` is installed it parses UTF-8 bodies; anything it rejects,
+        including content that is not ``bytes`` or ``str``, falls back to the
+        response's own ``json()``.
+
         Returns:
             Any: The JSON content of the response.
         """
+        if orjson is not None:
+            try:
+                return orjson.loads(self._response.content)
+            except (orjson.JSONDecodeError, TypeError):
+                pass
         return self._response.json()
 
-    @property
+    @cached_property
     def text(self) -> str:
         """
         Return the text content of the response.
 
+        The body is decoded on first access and cached on the instance.
+
         Returns:
             str: The text content of the response.
         """
@@ -89,6 +110,18 @@ class Response:
         """
         return dict(self._response.headers)
 
+    @cached_property
+    def headers_lower(self) -> dict[str, str]:
+        """
+        Return the headers of the response with lower-cased names.
+
+        The mapping is built on first access and cached on the instance.
+
+        Returns:
+            dict[str, str]: The headers of the response keyed by lower-cased name.
+        """
+        return {k.lower(): v for k, v in self._response.headers.items()}
+
     @property
     def cookies(self) -> dict[str, str]:
         """
@@ -108,3 +141,26 @@ class Response:
             str: The URL of the response.
         """
         return str(self._response.url)
+
+    @property
+    def reason_phrase(self) -> Any:
+        """
+        Return the reason phrase of the response.
+
+        The value is passed through unchanged, so a response without a reason
+        phrase keeps whatever the wrapped response reports (e.g. None).
+
+        Returns:
+            Any: The reason phrase of the response.
+        """
+        return self._response.reason_phrase
+
+    @property
+    def is_success(self) -> bool:
+        """
+        Return whether the response has a 2xx status code.
+
+        Returns:
+            bool: True if the response has a 2xx status code, False otherwise.
+        """
+        return bool(self._response.is_success)
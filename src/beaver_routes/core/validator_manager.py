@@ -4,6 +4,8 @@ from beaver_routes.validators.base import Validator
 from beaver_routes.exceptions.exceptions import ValidationError
 
 class ValidatorManager:
+    __slots__ = ("validators", "enabled")
+
     def __init__(self) -> None:
         self.validators: List[Validator] = []
         self.enabled = True
@@ -1,126 +1,146 @@
+from dataclasses import dataclass, field
 from http import HTTPStatus
-from typing import Any
-from unittest.mock import Mock
+from typing import Any, AsyncIterator, Callable, Mapping
 
 import httpx
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+from beaver_routes.core.request_handler import RequestHandler
 from beaver_routes.core.response import Response
 
 
-@pytest.fixture  # type: ignore
-def mock_httpx_client(monkeypatch: Any) -> None:
-    """Fixture to mock httpx.Client and httpx.AsyncClient for testing.
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> Mapping[str, Callable[[], Any]]:
+        """Run the asynchronous tests on uvloop when it is installed.
+
+        Args:
+            config (pytest.Config): The pytest configuration.
+            item (pytest.Item): The test item being parametrized.
+
+        Returns:
+            Mapping[str, Callable[[], Any]]: The event loop factory to use.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
 
-    This fixture replaces the request method of httpx.Client and httpx.AsyncClient
-    with a mock implementation that returns a predefined response. This is useful
-    for testing purposes to avoid making actual HTTP requests.
+_MOCK_RESPONSE_HEADERS = {"content-type": "application/json"}
+_MOCK_RESPONSE_CONTENT = b'{"key": "value"}'
+
+
+def _mock_handler(request: httpx.Request) -> httpx.Response:
+    """Answer every mocked request with the same JSON payload.
 
     Args:
-        monkeypatch (Any): The monkeypatch fixture provided by pytest for modifying attributes.
+        request (httpx.Request): The outgoing request.
 
-    Example:
-        >>> def test_example(mock_httpx_client):
-        ...     response = httpx.get("http://example.com")
-        ...     assert response.status_code == HTTPStatus.OK
+    Returns:
+        httpx.Response: A 200 response with a fixed JSON body.
     """
+    return httpx.Response(
+        HTTPStatus.OK, headers=_MOCK_RESPONSE_HEADERS, content=_MOCK_RESPONSE_CONTENT
+    )
 
-    class MockResponse:
-        """Mock response class to simulate httpx responses.
 
-        Attributes:
-            status_code (int): The HTTP status code of the response.
-            _json_data (Any): The JSON data to return when calling the json() method.
-        """
+_MOCK_TRANSPORT = httpx.MockTransport(_mock_handler)
 
-        def __init__(
-            self,
-            status_code: int = HTTPStatus.OK,
-            json_data: Any = None,
-            content: bytes = b"",
-            text: str = '{"key": "value"}',
-            cookies: dict[Any, Any] | None = {"session_id": "abc123"},
-        ) -> None:
-            self.status_code = status_code
-            self._json_data = json_data or {}
-            self.content = content
-            self.text = text
-            self.cookies = cookies
-
-        def json(self) -> Any:
-            """Return the JSON data of the mock response.
-
-            Returns:
-                Any: The JSON data of the response.
-            """
-            return self._json_data
-
-    async def mock_async_request(
-        self: Any, method: str, url: str, *, dummy: Any | None = None, **kwargs: Any
-    ) -> MockResponse:
-        """Mock async request method for httpx.AsyncClient.
 
-        Args:
-            self (Any): The instance of the calling object.
-            method (str): The HTTP method (e.g., "GET", "POST").
-            url (str): The URL for the request.
-            dummy (Any | None): A dummy argument for compatibility.
-            **kwargs (Any): Additional arguments for the request.
+@pytest.fixture(scope="module")  # type: ignore
+async def mock_request_handler() -> AsyncIterator[RequestHandler]:
+    """Module-scoped request handler backed by a mock transport.
 
-        Returns:
-            MockResponse: A mock response object.
-        """
-        return MockResponse()
+    The handler's sync and async clients use ``httpx.MockTransport``, so routes
+    given this handler never reach the network and httpx itself is left
+    unpatched. The clients are created once per test module and closed when
+    the module finishes.
 
-    def mock_request(
-        self: Any, method: str, url: str, *, dummy: Any | None = None, **kwargs: Any
-    ) -> MockResponse:
-        """Mock request method for httpx.Client.
+    Yields:
+        RequestHandler: The handler to assign to the routes under test.
 
-        Args:
-            self (Any): The instance of the calling object.
-            method (str): The HTTP method (e.g., "GET", "POST").
-            url (str): The URL for the request.
-            dummy (Any | None): A dummy argument for compatibility.
-            **kwargs (Any): Additional arguments for the request.
+    Example:
+        >>> def test_example(mock_request_handler):
+        ...     route = CustomRoute(
+        ...         "http://example.com", request_handler=mock_request_handler
+        ...     )
+        ...     assert route.get().status_code == HTTPStatus.OK
+    """
+    with httpx.Client(transport=_MOCK_TRANSPORT) as client:
+        async with httpx.AsyncClient(transport=_MOCK_TRANSPORT) as async_client:
+            yield RequestHandler(client=client, async_client=async_client)
 
-        Returns:
-            MockResponse: A mock response object.
-        """
-        return MockResponse()
 
-    monkeypatch.setattr(httpx.AsyncClient, "request", mock_async_request)
-    monkeypatch.setattr(httpx.Client, "request", mock_request)
+_HTTPX_RESPONSE_HEADERS = {"content-type": "application/json"}
+_HTTPX_RESPONSE_CONTENT = b'{"key": "value"}'
+_HTTPX_REQUEST = httpx.Request("GET", "https://example.com")
 
 
-@pytest.fixture  # type: ignore
+@pytest.fixture(scope="session")  # type: ignore
 def httpx_response() -> httpx.Response:
-    """Fixture for creating a mock HTTPX response."""
+    """Session-scoped fixture for creating a mock HTTPX response; treat as read-only."""
     response = httpx.Response(
         status_code=200,
-        headers={"content-type": "application/json"},
-        content=b'{"key": "value"}',
-        request=httpx.Request("GET", "https://example.com"),
+        headers=_HTTPX_RESPONSE_HEADERS,
+        content=_HTTPX_RESPONSE_CONTENT,
+        request=_HTTPX_REQUEST,
     )
     # Manually set cookies if needed
     response.cookies["session_id"] = "abc123"
     return response
 
 
-@pytest.fixture  # type: ignore
+@pytest.fixture(scope="session")  # type: ignore
 def response(httpx_response: Any) -> Response:
-    """Fixture for creating a beaver-routes Response."""
+    """Session-scoped fixture for creating a beaver-routes Response; treat as read-only."""
     return Response(httpx_response)
 
 
+@dataclass(slots=True)
+class _FakeResponse:
+    """Lightweight stand-in for an HTTP response used by the validator tests.
+
+    Attributes:
+        status_code (int): The HTTP status code of the response.
+        headers (dict[str, str]): The headers of the response.
+        cookies (dict[str, str]): The cookies of the response.
+        url (str): The URL of the response.
+        content (bytes): The byte content of the response.
+        text (str): The text content of the response.
+        _json (Any): The JSON data to return when calling the json() method.
+    """
+
+    status_code: int
+    headers: dict[str, str] = field(default_factory=dict)
+    cookies: dict[str, str] = field(default_factory=dict)
+    url: str = ""
+    content: bytes = b""
+    text: str = ""
+    _json: Any = None
+
+    def json(self) -> Any:
+        """Return the JSON data of the fake response.
+
+        Returns:
+            Any: The JSON data of the response.
+        """
+        return self._json
+
+
 @pytest.fixture  # type: ignore
-def mock_response():
-    mock_resp = Mock()
-    mock_resp.status_code = 200
-    mock_resp.headers = {"Content-Type": "application/json"}
-    mock_resp.cookies = {"session_id": "abc123"}
-    mock_resp.url = "https://example.com"
-    mock_resp.content = b"response content"
-    mock_resp.text = "response content"
-    mock_resp.json.return_value = {"key": "value"}
-    return mock_resp
+def mock_response() -> _FakeResponse:
+    """Fixture for creating a lightweight fake HTTP response."""
+    return _FakeResponse(
+        status_code=200,
+        headers={"Content-Type": "application/json"},
+        cookies={"session_id": "abc123"},
+        url="https://example.com",
+        content=b"response content",
+        text="response content",
+        _json={"key": "value"},
+    )
@@ -1,8 +1,12 @@
+import logging
+
 from beaver_routes.core.base_route import BaseRoute
 from beaver_routes.core.hook import Hook
 from beaver_routes.core.meta import Meta
 from beaver_routes.core.response import Response
 
+logger = logging.getLogger(__name__)
+
 
 class CustomRoute(BaseRoute):
     """Custom route class for testing and demonstration purposes.
@@ -171,7 +175,7 @@ class CustomRoute(BaseRoute):
         Example:
             >>> route_request_hook("GET", "http://example.com", Meta())
         """
-        print(f"Route request hook: {method} {url} {meta}")
+        logger.debug("Route request hook: %s %s %s", method, url, meta)
         meta.params.route_hook = "route_hook_value"
 
     def method_request_hook(self, method: str, url: str, meta: Meta) -> None:
@@ -185,7 +189,7 @@ class CustomRoute(BaseRoute):
         Example:
             >>> method_request_hook("GET", "http://example.com", Meta())
         """
-        print(f"Method request hook: {method} {url} {meta}")
+        logger.debug("Method request hook: %s %s %s", method, url, meta)
         meta.params.method_hook = "method_hook_value"
 
     def scenario_request_hook(self, method: str, url: str, meta: Meta) -> None:
@@ -199,7 +203,7 @@ class CustomRoute(BaseRoute):
         Example:
             >>> scenario_request_hook("GET", "http://example.com", Meta())
         """
-        print(f"Scenario request hook: {method} {url} {meta}")
+        logger.debug("Scenario request hook: %s %s %s", method, url, meta)
         meta.params.scenario_hook = "scenario_hook_value"
 
     def route_response_hook(self, response: Response) -> None:
@@ -211,7 +215,7 @@ class CustomRoute(BaseRoute):
         Example:
             >>> route_response_hook(Response(status_code=HTTPStatus.OK))
         """
-        print(f"Route response hook: {response.status_code}")
+        logger.debug("Route response hook: %s", response.status_code)
 
     def method_response_hook(self, response: Response) -> None:
         """Example method response hook.
@@ -222,7 +226,7 @@ class CustomRoute(BaseRoute):
         Example:
             >>> method_response_hook(Response(status_code=HTTPStatus.OK))
         """
-        print(f"Method response hook: {response.status_code}")
+        logger.debug("Method response hook: %s", response.status_code)
 
     def scenario_response_hook(self, response: Response) -> None:
         """Example scenario response hook.
@@ -233,4 +237,4 @@ class CustomRoute(BaseRoute):
         Example:
             >>> scenario_response_hook(Response(status_code=HTTPStatus.OK))
         """
-        print(f"Scenario response hook: {response.status_code}")
+        logger.debug("Scenario response hook: %s", response.status_code)
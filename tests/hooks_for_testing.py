@@ -1,8 +1,12 @@
+import logging
+
 from beaver_routes.core.meta import Meta
 from beaver_routes.core.response import Response
 
+logger = logging.getLogger(__name__)
+
 
-async def route_request_hook(method: str, url: str, meta: Meta) -> None:
+def route_request_hook(method: str, url: str, meta: Meta) -> None:
     """Example route request hook.
 
     Args:
@@ -11,13 +15,13 @@ async def route_request_hook(method: str, url: str, meta: Meta) -> None:
         meta (Meta): The request metadata.
 
     Example:
-        >>> await route_request_hook("GET", "http://example.com", Meta())
+        >>> route_request_hook("GET", "http://example.com", Meta())
     """
-    print(f"Route request hook: {method} {url} {meta}")
+    logger.debug("Route request hook: %s %s %s", method, url, meta)
     meta.params.route_hook = "route_hook_value"
 
 
-async def method_request_hook(method: str, url: str, meta: Meta) -> None:
+def method_request_hook(method: str, url: str, meta: Meta) -> None:
     """Example method request hook.
 
     Args:
@@ -26,13 +30,13 @@ async def method_request_hook(method: str, url: str, meta: Meta) -> None:
         meta (Meta): The request metadata.
 
     Example:
-        >>> await method_request_hook("GET", "http://example.com", Meta())
+        >>> method_request_hook("GET", "http://example.com", Meta())
     """
-    print(f"Method request hook: {method} {url} {meta}")
+    logger.debug("Method request hook: %s %s %s", method, url, meta)
     meta.params.method_hook = "method_hook_value"
 
 
-async def scenario_request_hook(method: str, url: str, meta: Meta) -> None:
+def scenario_request_hook(method: str, url: str, meta: Meta) -> None:
     """Example scenario request hook.
 
     Args:
@@ -41,43 +45,43 @@ async def scenario_request_hook(method: str, url: str, meta: Meta) -> None:
         meta (Meta): The request metadata.
 
     Example:
-        >>> await scenario_request_hook("GET", "http://example.com", Meta())
+        >>> scenario_request_hook("GET", "http://example.com", Meta())
     """
-    print(f"Scenario request hook: {method} {url} {meta}")
+    logger.debug("Scenario request hook: %s %s %s", method, url, meta)
     meta.params.scenario_hook = "scenario_hook_value"
 
 
-async def route_response_hook(response: Response) -> None:
+def route_response_hook(response: Response) -> None:
     """Example route response hook.
 
     Args:
         response (Response): The HTTP response.
 
     Example:
-        >>> await route_response_hook(Response(status_code=HTTPStatus.OK))
+        >>> route_response_hook(Response(status_code=HTTPStatus.OK))
     """
-    print(f"Route response hook: {response.status_code}")
+    logger.debug("Route response hook: %s", response.status_code)
 
 
-async def method_response_hook(response: Response) -> None:
+def method_response_hook(response: Response) -> None:
     """Example method response hook.
 
     Args:
         response (Response): The HTTP response.
 
     Example:
-        >>> await method_response_hook(Response(status_code=HTTPStatus.OK))
+        >>> method_response_hook(Response(status_code=HTTPStatus.OK))
     """
-    print(f"Method response hook: {response.status_code}")
+    logger.debug("Method response hook: %s", response.status_code)
 
 
-async def scenario_response_hook(response: Response) -> None:
+def scenario_response_hook(response: Response) -> None:
     """Example scenario response hook.
 
     Args:
         response (Response): The HTTP response.
 
     Example:
-        >>> await scenario_response_hook(Response(status_code=HTTPStatus.OK))
+        >>> scenario_response_hook(Response(status_code=HTTPStatus.OK))
     """
-    print(f"Scenario response hook: {response.status_code}")
+    logger.debug("Scenario response hook: %s", response.status_code)
@@ -1,12 +1,67 @@
+import asyncio
+from functools import lru_cache
 from http import HTTPStatus
+from typing import Any, AsyncIterator, Mapping, Tuple
 
+import httpx
 import pytest
+import pytest_asyncio
 
 from beaver_routes.core.base_route import BaseRoute
 from beaver_routes.core.hook import Hook
 from beaver_routes.core.meta import Meta
+from beaver_routes.core.request_handler import RequestHandler
+from beaver_routes.core.response import Response
 
 BASE_URL = "https://reqres.in/api"
+USERS_URL = f"{BASE_URL}/users"
+
+
+@lru_cache(maxsize=32)
+def _user_url(user_id: int) -> str:
+    """Return the endpoint of a single user, formatted once per user ID."""
+    return f"{USERS_URL}/{user_id}"
+
+
+_REQRES_TIMESTAMP = "2024-01-01T00:00:00.000Z"
+_REQRES_USERS = "/api/users"
+_REQRES_USER = "/api/users/2"
+
+_REQRES_ROUTES: Mapping[Tuple[str, str], Tuple[int, Any]] = {
+    ("GET", _REQRES_USERS): (
+        HTTPStatus.OK,
+        {"data": [{"id": 2, "first_name": "Janet", "last_name": "Weaver"}]},
+    ),
+    ("POST", _REQRES_USERS): (
+        HTTPStatus.CREATED,
+        {"id": "1", "createdAt": _REQRES_TIMESTAMP},
+    ),
+    ("PUT", _REQRES_USER): (HTTPStatus.OK, {"updatedAt": _REQRES_TIMESTAMP}),
+    ("PATCH", _REQRES_USER): (HTTPStatus.OK, {"updatedAt": _REQRES_TIMESTAMP}),
+    ("DELETE", _REQRES_USER): (HTTPStatus.NO_CONTENT, None),
+}
+_REQRES_NOT_FOUND: Tuple[int, Any] = (HTTPStatus.NOT_FOUND, None)
+
+
+def _reqres_handler(request: httpx.Request) -> httpx.Response:
+    """Serve canned reqres.in payloads for the users endpoints in-process.
+
+    Args:
+        request (httpx.Request): The outgoing request.
+
+    Returns:
+        httpx.Response: A response mirroring the reqres.in schema for the method
+            and path, or a 404 for any other request.
+    """
+    status_code, payload = _REQRES_ROUTES.get(
+        (request.method, request.url.path), _REQRES_NOT_FOUND
+    )
+    if payload is None:
+        return httpx.Response(status_code)
+    return httpx.Response(status_code, json=payload)
+
+
+_REQRES_TRANSPORT = httpx.MockTransport(_reqres_handler)
 
 
 class GetUsersRoute(BaseRoute):
@@ -21,7 +76,7 @@ class GetUsersRoute(BaseRoute):
 
     def __init__(self) -> None:
         """Initialize the GetUsersRoute with the users endpoint."""
-        super().__init__(f"{BASE_URL}/users")
+        super().__init__(USERS_URL)
 
     def __get__(self, meta: Meta, hooks: Hook) -> None:
         """Customize the GET-specific meta and hooks for this route.
@@ -49,7 +104,7 @@ class CreateUserRoute(BaseRoute):
 
     def __init__(self) -> None:
         """Initialize the CreateUserRoute with the users endpoint."""
-        super().__init__(f"{BASE_URL}/users")
+        super().__init__(USERS_URL)
 
     def __post__(self, meta: Meta, hooks: Hook) -> None:
         """Customize the POST-specific meta and hooks for this route.
@@ -81,7 +136,7 @@ class UpdateUserRoute(BaseRoute):
         Args:
             user_id (int): The ID of the user to update.
         """
-        super().__init__(f"{BASE_URL}/users/{user_id}")
+        super().__init__(_user_url(user_id))
 
     def __put__(self, meta: Meta, hooks: Hook) -> None:
         """Customize the PUT-specific meta and hooks for this route.
@@ -113,7 +168,7 @@ class DeleteUserRoute(BaseRoute):
         Args:
             user_id (int): The ID of the user to delete.
         """
-        super().__init__(f"{BASE_URL}/users/{user_id}")
+        super().__init__(_user_url(user_id))
 
     def __delete__(self, meta: Meta, hooks: Hook) -> None:
         """Customize the DELETE-specific meta and hooks for this route.
@@ -129,127 +184,112 @@ class DeleteUserRoute(BaseRoute):
         pass
 
 
-@pytest.mark.asyncio  # type: ignore
-async def test_get_users() -> None:
-    """Test the GetUsersRoute async GET request.
-
-    This test verifies that the GET request to the GetUsersRoute returns a 200 status code
-    and contains the expected data.
-
-    Example:
-        >>> await test_get_users()
-    """
-    route = GetUsersRoute()
-    response = await route.async_get()
-    assert response.status_code == HTTPStatus.OK
-    assert "data" in response.json_content
-
-
-@pytest.mark.asyncio  # type: ignore
-async def test_create_user() -> None:
-    """Test the CreateUserRoute async POST request.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")  # type: ignore
+async def shared_request_handler() -> AsyncIterator[RequestHandler]:
+    """Session-scoped request handler that serves reqres.in in-process.
 
-    This test verifies that the POST request to the CreateUserRoute returns a 201 status code
-    and contains the expected data.
+    Every route under test is given this handler, so its requests go through
+    one httpx.Client and one httpx.AsyncClient built on the fake reqres.in
+    transport. Both clients are closed when the session ends.
 
-    Example:
-        >>> await test_create_user()
+    Yields:
+        RequestHandler: The handler assigned to the routes under test.
     """
-    route = CreateUserRoute()
-    response = await route.async_post()
-    assert response.status_code == HTTPStatus.CREATED
-    json_response = response.json_content
-    assert "id" in json_response
-    assert "createdAt" in json_response
+    with httpx.Client(transport=_REQRES_TRANSPORT) as client:
+        async with httpx.AsyncClient(transport=_REQRES_TRANSPORT) as async_client:
+            yield RequestHandler(client=client, async_client=async_client)
 
 
-@pytest.mark.asyncio  # type: ignore
-async def test_update_user() -> None:
-    """Test the UpdateUserRoute async PUT request.
+_CacheKey = tuple[str, str, type[BaseRoute], tuple[Any, ...]]
 
-    This test verifies that the PUT request to the UpdateUserRoute returns a 200 status code
-    and contains the expected data.
-
-    Example:
-        >>> await test_update_user()
-    """
-    route = UpdateUserRoute(user_id=2)
-    response = await route.async_put()
-    assert response.status_code == HTTPStatus.OK
-    json_response = response.json_content
-    assert "updatedAt" in json_response
+ROUTE_CASES: list[
+    tuple[str, type[BaseRoute], tuple[Any, ...], str, int, tuple[str, ...]]
+] = [
+    ("get", GetUsersRoute, (), USERS_URL, HTTPStatus.OK, ("data",)),
+    ("post", CreateUserRoute, (), USERS_URL, HTTPStatus.CREATED, ("id", "createdAt")),
+    ("put", UpdateUserRoute, (2,), _user_url(2), HTTPStatus.OK, ("updatedAt",)),
+    ("delete", DeleteUserRoute, (2,), _user_url(2), HTTPStatus.NO_CONTENT, ()),
+]
 
 
-@pytest.mark.asyncio  # type: ignore
-async def test_delete_user() -> None:
-    """Test the DeleteUserRoute async DELETE request.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")  # type: ignore
+async def response_cache(
+    shared_request_handler: RequestHandler,
+) -> dict[_CacheKey, Response]:
+    """Session-scoped responses for every route case, keyed by mode and case.
 
-    This test verifies that the DELETE request to the DeleteUserRoute returns a 204 status code.
+    Each case in ``ROUTE_CASES`` is requested exactly once through the sync API
+    and once through the async API.
 
-    Example:
-        >>> await test_delete_user()
+    Returns:
+        dict: The responses keyed by ``(mode, method, route_cls, args)``.
     """
-    route = DeleteUserRoute(user_id=2)
-    response = await route.async_delete()
-    assert response.status_code == HTTPStatus.NO_CONTENT
-
-
-def test_sync_get_users() -> None:
-    """Test the GetUsersRoute sync GET request.
-
-    This test verifies that the GET request to the GetUsersRoute returns a 200 status code
-    and contains the expected data.
-
-    Example:
-        >>> test_sync_get_users()
+    cache: dict[_CacheKey, Response] = {}
+    for method, route_cls, args, _, _, _ in ROUTE_CASES:
+        route = route_cls(*args)
+        route.request_handler = shared_request_handler
+        cache["sync", method, route_cls, args] = getattr(route, method)()
+        cache["async", method, route_cls, args] = await getattr(
+            route, f"async_{method}"
+        )()
+    return cache
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])  # type: ignore
+@pytest.mark.parametrize(  # type: ignore
+    "method, route_cls, args, url, status, keys",
+    ROUTE_CASES,
+    ids=[case[0] for case in ROUTE_CASES],
+)
+def test_route(
+    mode: str,
+    method: str,
+    route_cls: type[BaseRoute],
+    args: tuple[Any, ...],
+    url: str,
+    status: int,
+    keys: tuple[str, ...],
+    response_cache: dict[_CacheKey, Response],
+) -> None:
+    """Test the reqres.in routes through the sync and async APIs.
+
+    This test verifies that each route sends the expected method to the expected
+    URL, returns the expected status code, and that the JSON body contains the
+    expected keys. ``response.request`` is the request the transport received.
     """
-    route = GetUsersRoute()
-    response = route.get()
-    assert response.status_code == HTTPStatus.OK
-    assert "data" in response.json_content
-
-
-def test_sync_create_user() -> None:
-    """Test the CreateUserRoute sync POST request.
-
-    This test verifies that the POST request to the CreateUserRoute returns a 201 status code
-    and contains the expected data.
-
-    Example:
-        >>> test_sync_create_user()
-    """
-    route = CreateUserRoute()
-    response = route.post()
-    assert response.status_code == HTTPStatus.CREATED
-    json_response = response.json_content
-    assert "id" in json_response
-    assert "createdAt" in json_response
-
-
-def test_sync_update_user() -> None:
-    """Test the UpdateUserRoute sync PUT request.
-
-    This test verifies that the PUT request to the UpdateUserRoute returns a 200 status code
-    and contains the expected data.
-
-    Example:
-        >>> test_sync_update_user()
-    """
-    route = UpdateUserRoute(user_id=2)
-    response = route.put()
-    assert response.status_code == HTTPStatus.OK
-    json_response = response.json_content
-    assert "updatedAt" in json_response
-
+    response = response_cache[mode, method, route_cls, args]
+    assert response.request.method == method.upper()
+    assert str(response.request.url.copy_with(query=None)) == url
+    assert response.status_code == status
+    for key in keys:
+        assert key in response.json_content
 
-def test_sync_delete_user() -> None:
-    """Test the DeleteUserRoute sync DELETE request.
 
-    This test verifies that the DELETE request to the DeleteUserRoute returns a 204 status code.
+def test_async_request_closes_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that async requests without an injected client leave no client open.
 
-    Example:
-        >>> test_sync_delete_user()
+    This test verifies that every client opened by repeated ``asyncio.run`` calls
+    on a route using the default request handler is closed afterwards, so no
+    client, connection or event loop is left behind.
     """
-    route = DeleteUserRoute(user_id=2)
-    response = route.delete()
-    assert response.status_code == HTTPStatus.NO_CONTENT
+    clients: list[httpx.AsyncClient] = []
+    init = httpx.AsyncClient.__init__
+
+    def tracking_init(self: httpx.AsyncClient, *args: Any, **kwargs: Any) -> None:
+        init(self, *args, **kwargs)
+        clients.append(self)
+
+    async def handle_async_request(
+        self: httpx.AsyncHTTPTransport, request: httpx.Request
+    ) -> httpx.Response:
+        return await _REQRES_TRANSPORT.handle_async_request(request)
+
+    monkeypatch.setattr(httpx.AsyncClient, "__init__", tracking_init)
+    monkeypatch.setattr(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+    )
+    for _ in range(5):
+        response = asyncio.run(GetUsersRoute().async_get())
+        assert response.status_code == HTTPStatus.OK
+    assert len(clients) == 5
+    assert all(client.is_closed for client in clients)
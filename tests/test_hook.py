@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+from beaver_routes.core.hook import Hook
+from beaver_routes.core.meta import Meta
+from beaver_routes.core.response import Response
+from tests.hooks_for_testing import (
+    method_request_hook,
+    method_response_hook,
+    route_request_hook,
+    route_response_hook,
+    scenario_request_hook,
+    scenario_response_hook,
+)
+
+
+@pytest.fixture  # type: ignore
+def hook() -> Hook:
+    """Fixture for a Hook with the example route, method and scenario hooks."""
+    hook = Hook()
+    hook.add("request", route_request_hook)
+    hook.add("request", method_request_hook)
+    hook.add("request", scenario_request_hook)
+    hook.add("response", route_response_hook)
+    hook.add("response", method_response_hook)
+    hook.add("response", scenario_response_hook)
+    return hook
+
+
+def test_apply_request_hooks(hook: Hook) -> None:
+    """Test applying the request hooks.
+
+    This test verifies that every request hook runs and updates the request metadata.
+
+    Example:
+        >>> test_apply_request_hooks(hook)
+    """
+    meta = Meta()
+    hook.apply_hooks("request", "GET", "http://example.com", meta)
+    assert meta.params.route_hook == "route_hook_value"
+    assert meta.params.method_hook == "method_hook_value"
+    assert meta.params.scenario_hook == "scenario_hook_value"
+
+
+async def test_async_apply_request_hooks(hook: Hook) -> None:
+    """Test applying plain function request hooks on the async path.
+
+    This test verifies that plain function hooks run without being awaited.
+
+    Example:
+        >>> await test_async_apply_request_hooks(hook)
+    """
+    meta = Meta()
+    await hook.async_apply_hooks("request", "GET", "http://example.com", meta)
+    assert meta.params.route_hook == "route_hook_value"
+    assert meta.params.method_hook == "method_hook_value"
+    assert meta.params.scenario_hook == "scenario_hook_value"
+
+
+def test_apply_response_hooks(
+    hook: Hook, response: Response, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test applying the response hooks.
+
+    This test verifies that every response hook runs and logs the status code.
+
+    Example:
+        >>> test_apply_response_hooks(hook, response, caplog)
+    """
+    caplog.set_level(logging.DEBUG, logger="tests.hooks_for_testing")
+    hook.apply_hooks("response", response)
+    assert caplog.messages == [
+        "Route response hook: 200",
+        "Method response hook: 200",
+        "Scenario response hook: 200",
+    ]
+
+
+def test_apply_invalid_event(hook: Hook) -> None:
+    """Test applying hooks for an invalid event.
+
+    This test verifies that a ValueError is raised for an unknown event.
+
+    Example:
+        >>> test_apply_invalid_event(hook)
+    """
+    with pytest.raises(ValueError):
+        hook.apply_hooks("invalid_event")
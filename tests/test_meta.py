@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from box import Box
 
@@ -101,6 +103,32 @@ def test_add() -> None:
     assert meta3.json.key == "value"
 
 
+def test_add_nested() -> None:
+    """Test adding Meta instances with nested and one-sided sections.
+
+    This test verifies that nested dictionaries are merged recursively without
+    mutating the operands, and that sections set only on the right operand are kept.
+
+    Example:
+        >>> test_add_nested()
+    """
+    meta1 = Meta(json={"a": {"x": 1}})
+    meta2 = Meta(json={"a": {"y": 2}, "b": [1]})
+    meta2.url = "http://example.com"
+    meta3 = meta1 + meta2
+    assert meta3.json.to_dict() == {"a": {"x": 1, "y": 2}, "b": [1]}
+    assert meta3.url == "http://example.com"
+    assert meta1.json.to_dict() == {"a": {"x": 1}}
+    assert isinstance(meta3.json.a, Box)
+
+    meta4 = Meta(params={"a": 1})
+    meta5 = Meta()
+    meta5.params = None
+    meta6 = meta4 + meta5
+    meta6.params.z = 2
+    assert meta4.params.to_dict() == {"a": 1}
+
+
 def test_copy() -> None:
     """Test copying a Meta instance.
 
@@ -117,6 +145,48 @@ def test_copy() -> None:
     assert meta1.params.q != meta2.params.q
 
 
+def test_copy_module() -> None:
+    """Test shallow-copying a Meta instance with the copy module.
+
+    This test verifies that copy.copy returns a Meta with the same sections.
+
+    Example:
+        >>> test_copy_module()
+    """
+    meta = Meta(params={"q": "search1"})
+    meta_copy = copy.copy(meta)
+    assert isinstance(meta_copy, Meta)
+    assert meta_copy.params.q == "search1"
+
+
+def test_dir_and_vars() -> None:
+    """Test introspecting a Meta instance.
+
+    This test verifies that dir() and vars() work on a Meta instance.
+
+    Example:
+        >>> test_dir_and_vars()
+    """
+    meta = Meta(params={"q": "search1"})
+    assert "to_dict" in dir(meta)
+    assert vars(meta) == {"_attributes": {"params": {"q": "search1"}}}
+
+
+def test_deepcopy() -> None:
+    """Test deep-copying a Meta instance with the copy module.
+
+    This test verifies that copy.deepcopy returns an independent Meta instance.
+
+    Example:
+        >>> test_deepcopy()
+    """
+    meta = Meta(params={"q": "search1"}, json={"a": {"b": 1}})
+    meta_copy = copy.deepcopy(meta)
+    assert meta_copy.to_dict() == meta.to_dict()
+    meta_copy.json.a.b = 2
+    assert meta.json.a.b == 1
+
+
 def test_repr_str() -> None:
     """Test string representation of Meta.
 
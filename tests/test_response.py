@@ -1,5 +1,9 @@
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
 
+from beaver_routes.core import response as response_module
 from beaver_routes.core.response import Response
 
 
@@ -11,10 +15,14 @@ def test_status_code(response: Response) -> None:
 def test_headers(response: Response) -> None:
     """Test the headers property."""
     expected_headers = {"Content-Type": "application/json"}
-    actual_headers = {k.lower(): v for k, v in response.headers.items()}
     expected_headers_lower = {k.lower(): v for k, v in expected_headers.items()}
     for key, value in expected_headers_lower.items():
-        assert actual_headers[key] == value
+        assert response.headers_lower[key] == value
+
+
+def test_headers_lower_cached(response: Response) -> None:
+    """Test that headers_lower is built once per response."""
+    assert response.headers_lower is response.headers_lower
 
 
 def test_cookies(response: Response) -> None:
@@ -42,11 +50,40 @@ def test_json_content(response: Response) -> None:
     assert response.json_content == {"key": "value"}
 
 
+def test_json_content_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that content orjson rejects with TypeError falls back to json()."""
+
+    def loads(content: Any) -> Any:
+        raise TypeError("Input must be bytes, bytearray, memoryview, or str")
+
+    fake_orjson = SimpleNamespace(loads=loads, JSONDecodeError=ValueError)
+    monkeypatch.setattr(response_module, "orjson", fake_orjson)
+    stub = SimpleNamespace(content=None, json=lambda: {"key": "value"})
+    assert Response(stub).json_content == {"key": "value"}
+
+
+def test_decoded_body_cached(response: Response) -> None:
+    """Test that the text and JSON content are decoded once per response."""
+    assert response.text is response.text
+    assert response.json_content is response.json_content
+
+
 def test_getattr(response: Response) -> None:
     """Test __getattr__ method."""
+    assert response.http_version == "HTTP/1.1"
+    assert response.request.method == "GET"
+
+
+def test_reason_phrase_and_is_success(response: Response) -> None:
+    """Test the reason_phrase and is_success properties."""
     assert response.reason_phrase == "OK"
     assert response.is_success
 
 
+def test_reason_phrase_passthrough() -> None:
+    """Test that a missing reason phrase is returned unchanged."""
+    assert Response(SimpleNamespace(reason_phrase=None)).reason_phrase is None
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,276 +1,227 @@
 from __future__ import annotations
 
+import copy
+import re
 from http import HTTPStatus
-from typing import Any
 
 import pytest
 
 from beaver_routes.core.hook import Hook
 from beaver_routes.core.meta import Meta
+from beaver_routes.core.request_handler import RequestHandler
 from beaver_routes.core.response import Response
-from beaver_routes.exceptions.exceptions import MetaError
 from tests.custom_route import CustomRoute
 
+HTTP_VERBS = ("get", "post", "put", "delete", "patch", "head", "options")
+_URL = "https://jsonplaceholder.typicode.com/posts/1"
+_PREP_FAIL_RE = re.compile("Failed to prepare httpx arguments")
 
-@pytest.mark.usefixtures("mock_httpx_client")
-class TestBaseRoute:
-    """Test suite for BaseRoute class.
-
-    This test suite includes tests for initializing routes, handling hooks, and making HTTP requests.
-    """
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_route_initialization(self) -> None:
-        """Test route initialization.
+class UnserializableContentRoute(CustomRoute):
+    """Route whose GET content cannot be serialized, so Meta conversion fails."""
 
-        This test verifies that the route is initialized with the correct endpoint, meta, and hooks.
+    def __get__(self, meta: Meta, hooks: Hook) -> None:
+        """Add GET content that cannot be encoded as JSON.
 
-        Example:
-            >>> await test_route_initialization()
+        Args:
+            meta (Meta): The GET request metadata.
+            hooks (Hook): The GET request hooks.
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        assert route.endpoint == "https://jsonplaceholder.typicode.com/posts/1"
-        assert isinstance(route.meta, Meta)
-        assert isinstance(route.hooks, Hook)
+        super().__get__(meta, hooks)
+        meta.content = {"payload": object()}
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_invalid_hook_event(self) -> None:
-        """Test handling of invalid hook event.
 
-        This test verifies that a ValueError is raised when adding a hook with an invalid event.
+class AsyncHookRoute(CustomRoute):
+    """Route that adds an ``async def`` request hook for GET requests."""
 
-        Example:
-            >>> await test_invalid_hook_event()
-        """
-        with pytest.raises(ValueError):
-            route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-            route.hooks.add("invalid_event", lambda x: x)
-
-    @pytest.mark.asyncio  # type: ignore
-    async def test_no_scenario_func(self) -> None:
-        """Test handling of non-existent scenario function.
+    awaited = False
 
-        This test verifies that an AttributeError is raised when trying to apply a non-existent scenario function.
+    def __get__(self, meta: Meta, hooks: Hook) -> None:
+        """Add a coroutine request hook on top of the GET hooks.
 
-        Example:
-            >>> await test_no_scenario_func()
+        Args:
+            meta (Meta): The GET request metadata.
+            hooks (Hook): The GET request hooks.
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        with pytest.raises(AttributeError):
-            await route.for_scenario("non_existent_scenario").async_get()
+        super().__get__(meta, hooks)
+        hooks.add("request", self.async_request_hook)
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_meta_exception(self, monkeypatch: Any) -> None:
-        """Test handling of MetaError exception.
-
-        This test verifies that a RuntimeError is raised when a MetaError occurs during request preparation.
+    async def async_request_hook(self, method: str, url: str, meta: Meta) -> None:
+        """Record that the coroutine hook was awaited.
 
         Args:
-            monkeypatch (Any): The monkeypatch fixture provided by pytest for modifying attributes.
-
-        Example:
-            >>> await test_meta_exception(monkeypatch)
+            method (str): The HTTP method.
+            url (str): The request URL.
+            meta (Meta): The request metadata.
         """
+        self.awaited = True
 
-        def mock_to_httpx_args_raise(meta: Meta, method: str) -> None:
-            raise MetaError("Meta Exception")
-
-        monkeypatch.setattr(Meta, "to_httpx_args", mock_to_httpx_args_raise)
 
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        with pytest.raises(RuntimeError, match="Failed to prepare httpx arguments"):
-            await route.async_get()
+@pytest.fixture(scope="class")  # type: ignore
+def route(mock_request_handler: RequestHandler) -> CustomRoute:
+    """Class-scoped route shared by the tests that do not modify it.
 
-    def test_sync_get(self) -> None:
-        """Test synchronous GET request.
+    Invoking a route copies its meta and builds fresh hooks, so requests
+    leave the route untouched. Tests that set a scenario or patch Meta
+    still build their own route.
 
-        This test verifies that the GET request returns a 200 status code.
+    Args:
+        mock_request_handler (RequestHandler): The handler backed by the mock transport.
 
-        Example:
-            >>> test_sync_get()
-        """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.get()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+    Returns:
+        CustomRoute: The shared route instance.
+    """
+    return CustomRoute(_URL, request_handler=mock_request_handler)
 
-    def test_sync_post(self) -> None:
-        """Test synchronous POST request.
 
-        This test verifies that the POST request returns a 200 status code.
+class TestBaseRoute:
+    """Test suite for BaseRoute class.
 
-        Example:
-            >>> test_sync_post()
-        """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.post()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+    This test suite includes tests for initializing routes, handling hooks, and making HTTP requests.
+    """
 
-    def test_sync_put(self) -> None:
-        """Test synchronous PUT request.
+    async def test_route_initialization(self, route: CustomRoute) -> None:
+        """Test route initialization.
 
-        This test verifies that the PUT request returns a 200 status code.
+        This test verifies that the route is initialized with the correct endpoint, meta, and hooks.
 
         Example:
-            >>> test_sync_put()
+            >>> await test_route_initialization()
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.put()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
-
-    def test_sync_delete(self) -> None:
-        """Test synchronous DELETE request.
+        assert route.endpoint == _URL
+        assert isinstance(route.meta, Meta)
+        assert isinstance(route.hooks, Hook)
 
-        This test verifies that the DELETE request returns a 200 status code.
+    def test_request_handler_per_route(
+        self, mock_request_handler: RequestHandler
+    ) -> None:
+        """Test that a request handler can be assigned to a single route.
 
-        Example:
-            >>> test_sync_delete()
-        """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.delete()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+        This test verifies that routes share the default handler unless one is
+        passed to the constructor or assigned, and that doing so does not affect
+        other routes.
 
-    def test_sync_patch(self) -> None:
-        """Test synchronous PATCH request.
-
-        This test verifies that the PATCH request returns a 200 status code.
+        Args:
+            mock_request_handler (RequestHandler): The handler backed by the mock transport.
 
         Example:
-            >>> test_sync_patch()
+            >>> test_request_handler_per_route(mock_request_handler)
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.patch()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+        route = CustomRoute(_URL)
+        other = CustomRoute(_URL)
+        assert route.request_handler is other.request_handler
+        injected = CustomRoute(_URL, request_handler=mock_request_handler)
+        assert injected.request_handler is mock_request_handler
+        route.request_handler = mock_request_handler
+        assert route.request_handler is mock_request_handler
+        assert other.request_handler is not mock_request_handler
 
-    def test_sync_head(self) -> None:
-        """Test synchronous HEAD request.
+    def test_route_deepcopy(self) -> None:
+        """Test deep-copying a route.
 
-        This test verifies that the HEAD request returns a 200 status code.
+        This test verifies that copy.deepcopy copies the route and its Meta.
 
         Example:
-            >>> test_sync_head()
+            >>> test_route_deepcopy()
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.head()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+        route = CustomRoute(_URL)
+        route.meta.params.q = "search1"
+        route_copy = copy.deepcopy(route)
+        assert route_copy.endpoint == _URL
+        assert route_copy.meta.params.q == "search1"
+        assert route_copy.meta is not route.meta
 
-    def test_sync_options(self) -> None:
-        """Test synchronous OPTIONS request.
+    async def test_invalid_hook_event(self) -> None:
+        """Test handling of invalid hook event.
 
-        This test verifies that the OPTIONS request returns a 200 status code.
+        This test verifies that a ValueError is raised when adding a hook with an invalid event.
 
         Example:
-            >>> test_sync_options()
+            >>> await test_invalid_hook_event()
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = route.options()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+        with pytest.raises(ValueError):
+            route = CustomRoute(_URL)
+            route.hooks.add("invalid_event", lambda x: x)
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_get(self) -> None:
-        """Test asynchronous GET request.
+    async def test_no_scenario_func(self) -> None:
+        """Test handling of non-existent scenario function.
 
-        This test verifies that the GET request returns a 200 status code.
+        This test verifies that an AttributeError is raised when trying to apply a non-existent scenario function.
 
         Example:
-            >>> await test_async_get()
+            >>> await test_no_scenario_func()
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_get()
-        assert response.status_code == HTTPStatus.OK
-        assert isinstance(response, Response)
-        assert response.text == '{"key": "value"}'
+        route = CustomRoute(_URL)
+        with pytest.raises(AttributeError):
+            await route.for_scenario("non_existent_scenario").async_get()
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_post(self) -> None:
-        """Test asynchronous POST request.
+    async def test_meta_exception(self) -> None:
+        """Test handling of MetaError exception.
 
-        This test verifies that the POST request returns a 200 status code.
+        This test verifies that a RuntimeError is raised when a MetaError occurs during request preparation.
 
         Example:
-            >>> await test_async_post()
+            >>> await test_meta_exception()
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_post()
-        assert response.status_code == HTTPStatus.OK
-
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_put(self) -> None:
-        """Test asynchronous PUT request.
-
-        This test verifies that the PUT request returns a 200 status code.
+        route = UnserializableContentRoute(_URL)
+        with pytest.raises(RuntimeError, match=_PREP_FAIL_RE):
+            await route.async_get()
 
-        Example:
-            >>> await test_async_put()
-        """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_put()
-        assert response.status_code == HTTPStatus.OK
+    async def test_async_hook_awaited(
+        self, mock_request_handler: RequestHandler
+    ) -> None:
+        """Test that coroutine hooks are awaited on the async request path.
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_delete(self) -> None:
-        """Test asynchronous DELETE request.
+        This test verifies that an ``async def`` request hook runs alongside the
+        plain function hooks when the route is called asynchronously.
 
-        This test verifies that the DELETE request returns a 200 status code.
+        Args:
+            mock_request_handler (RequestHandler): The handler backed by the mock transport.
 
         Example:
-            >>> await test_async_delete()
+            >>> await test_async_hook_awaited(mock_request_handler)
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_delete()
-        assert response.status_code == HTTPStatus.OK
-
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_patch(self) -> None:
-        """Test asynchronous PATCH request.
-
-        This test verifies that the PATCH request returns a 200 status code.
+        route = AsyncHookRoute(_URL, request_handler=mock_request_handler)
+        await route.async_get()
+        assert route.awaited
 
-        Example:
-            >>> await test_async_patch()
-        """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_patch()
-        assert response.status_code == HTTPStatus.OK
+    @pytest.mark.parametrize("verb", HTTP_VERBS)  # type: ignore
+    def test_sync_verbs(self, route: CustomRoute, verb: str) -> None:
+        """Test synchronous requests for every HTTP method.
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_head(self) -> None:
-        """Test asynchronous HEAD request.
+        This test verifies that each synchronous request returns a 200 status code
+        and the mocked response body.
 
-        This test verifies that the HEAD request returns a 200 status code.
+        Args:
+            route (CustomRoute): The shared route fixture.
+            verb (str): The lower-case HTTP method name of the route call.
 
         Example:
-            >>> await test_async_head()
+            >>> test_sync_verbs(route, "get")
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_head()
+        response = getattr(route, verb)()
         assert response.status_code == HTTPStatus.OK
+        assert isinstance(response, Response)
+        assert response.text == '{"key": "value"}'
 
-    @pytest.mark.asyncio  # type: ignore
-    async def test_async_options(self) -> None:
-        """Test asynchronous OPTIONS request.
+    @pytest.mark.parametrize("verb", HTTP_VERBS)  # type: ignore
+    async def test_async_verbs(self, route: CustomRoute, verb: str) -> None:
+        """Test asynchronous requests for every HTTP method.
 
-        This test verifies that the OPTIONS request returns a 200 status code.
+        This test verifies that each asynchronous request returns a 200 status code
+        and the mocked response body.
+
+        Args:
+            route (CustomRoute): The shared route fixture.
+            verb (str): The lower-case HTTP method name of the route call.
 
         Example:
-            >>> await test_async_options()
+            >>> await test_async_verbs(route, "get")
         """
-        route = CustomRoute("https://jsonplaceholder.typicode.com/posts/1")
-        response = await route.async_options()
+        response = await getattr(route, f"async_{verb}")()
         assert response.status_code == HTTPStatus.OK
+        assert isinstance(response, Response)
+        assert response.text == '{"key": "value"}'
 
 
 if __name__ == "__main__":